@@ -15,6 +15,8 @@ limitations under the License.
 
 #include "tensorflow/core/lib/io/buffered_inputstream.h"
 
+#include <string.h>
+
 #include "tensorflow/core/lib/io/random_inputstream.h"
 
 namespace tensorflow {
@@ -58,17 +60,29 @@ Status BufferedInputStream::ReadLineHelper(string* result, bool include_eol) {
         break;
       }
     }
-    char c = buf_[pos_++];
-    if (c == '\n') {
+    // Append the buffered data up to the next '\n' in bulk rather than one
+    // character at a time, so long lines don't repeatedly regrow *result.
+    const char* start = buf_.data() + pos_;
+    const char* end = buf_.data() + limit_;
+    const char* eol =
+        static_cast<const char*>(memchr(start, '\n', end - start));
+    const char* stop = eol != nullptr ? eol : end;
+    // We don't append '\r' to *result
+    while (start < stop) {
+      const char* cr =
+          static_cast<const char*>(memchr(start, '\r', stop - start));
+      const char* run_end = cr != nullptr ? cr : stop;
+      result->append(start, run_end - start);
+      start = cr != nullptr ? cr + 1 : stop;
+    }
+    if (eol != nullptr) {
+      pos_ = eol - buf_.data() + 1;
       if (include_eol) {
-        *result += c;
+        *result += '\n';
       }
       return Status::OK();
     }
-    // We don't append '\r' to *result
-    if (c != '\r') {
-      *result += c;
-    }
+    pos_ = limit_;
   }
   if (errors::IsOutOfRange(s) && !result->empty()) {
     return Status::OK();
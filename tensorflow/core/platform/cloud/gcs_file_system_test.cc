@@ -863,6 +863,85 @@ TEST(GcsFileSystemTest, DeleteDir_NonEmpty) {
             fs.DeleteDir("gs://bucket/path/").code());
 }
 
+TEST(GcsFileSystemTest, DeleteRecursively_SubfolderAndDirMarker) {
+  std::vector<HttpRequest*> requests(
+      {// Check that the directory exists: not an object, but a folder.
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o/"
+           "path?fields=size%2Cupdated\n"
+           "Auth Token: fake_token\n",
+           "", errors::NotFound("404"), 404),
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2CnextPageToken&prefix=path%2F"
+           "&maxResults=1\n"
+           "Auth Token: fake_token\n",
+           "{\"items\": [{\"name\": \"path/\"}]}"),
+       // List the directory: its marker, a file and a subfolder.
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2Cprefixes%2CnextPageToken&delimiter=%2F&"
+           "prefix=path%2F\n"
+           "Auth Token: fake_token\n",
+           "{\"items\": [ "
+           "  { \"name\": \"path/\" },"
+           "  { \"name\": \"path/file1.txt\" }],"
+           "\"prefixes\": [\"path/subpath/\"]}"),
+       // The file is deleted directly.
+       new FakeHttpRequest("Uri: https://www.googleapis.com/storage/v1/b"
+                           "/bucket/o/path%2Ffile1.txt\n"
+                           "Auth Token: fake_token\n"
+                           "Delete: yes\n",
+                           ""),
+       // The subfolder is checked to be a directory, not deleted as a file.
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2CnextPageToken&prefix=path%2Fsubpath%2F"
+           "&maxResults=1\n"
+           "Auth Token: fake_token\n",
+           "{\"items\": [{\"name\": \"path/subpath/file2.txt\"}]}"),
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2Cprefixes%2CnextPageToken&delimiter=%2F&"
+           "prefix=path%2Fsubpath%2F\n"
+           "Auth Token: fake_token\n",
+           "{\"items\": [ "
+           "  { \"name\": \"path/subpath/file2.txt\" }]}"),
+       new FakeHttpRequest("Uri: https://www.googleapis.com/storage/v1/b"
+                           "/bucket/o/path%2Fsubpath%2Ffile2.txt\n"
+                           "Auth Token: fake_token\n"
+                           "Delete: yes\n",
+                           ""),
+       // Delete the now empty subfolder, then the directory and its marker.
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2CnextPageToken&prefix=path%2Fsubpath%2F"
+           "&maxResults=2\n"
+           "Auth Token: fake_token\n",
+           "{}"),
+       new FakeHttpRequest(
+           "Uri: https://www.googleapis.com/storage/v1/b/bucket/o?"
+           "fields=items%2Fname%2CnextPageToken&prefix=path%2F"
+           "&maxResults=2\n"
+           "Auth Token: fake_token\n",
+           "{\"items\": [{\"name\": \"path/\"}]}"),
+       new FakeHttpRequest("Uri: https://www.googleapis.com/storage/v1/b"
+                           "/bucket/o/path%2F\n"
+                           "Auth Token: fake_token\n"
+                           "Delete: yes\n",
+                           "")});
+  GcsFileSystem fs(std::unique_ptr<AuthProvider>(new FakeAuthProvider),
+                   std::unique_ptr<HttpRequest::Factory>(
+                       new FakeHttpRequestFactory(&requests)),
+                   0 /* read ahead bytes */, 5 /* max upload attempts */);
+
+  int64 undeleted_files, undeleted_dirs;
+  TF_EXPECT_OK(fs.DeleteRecursively("gs://bucket/path", &undeleted_files,
+                                    &undeleted_dirs));
+  EXPECT_EQ(0, undeleted_files);
+  EXPECT_EQ(0, undeleted_dirs);
+}
+
 TEST(GcsFileSystemTest, GetFileSize) {
   std::vector<HttpRequest*> requests({new FakeHttpRequest(
       "Uri: https://www.googleapis.com/storage/v1/b/bucket/o/"
@@ -13,7 +13,6 @@ See the License for the specific language governing permissions and
 limitations under the License.
 ==============================================================================*/
 
-#include <deque>
 #include <vector>
 
 #include "tensorflow/core/lib/core/errors.h"
@@ -197,66 +196,9 @@ Status Env::IsDirectory(const string& fname) {
 
 Status Env::DeleteRecursively(const string& dirname, int64* undeleted_files,
                               int64* undeleted_dirs) {
-  CHECK_NOTNULL(undeleted_files);
-  CHECK_NOTNULL(undeleted_dirs);
   FileSystem* fs;
   TF_RETURN_IF_ERROR(GetFileSystemForFile(dirname, &fs));
-
-  *undeleted_files = 0;
-  *undeleted_dirs = 0;
-  // Make sure that dirname exists;
-  if (!FileExists(dirname)) {
-    (*undeleted_dirs)++;
-    return Status(error::NOT_FOUND, "Directory doesn't exist");
-  }
-  std::deque<string> dir_q;      // Queue for the BFS
-  std::vector<string> dir_list;  // List of all dirs discovered
-  dir_q.push_back(dirname);
-  Status ret;  // Status to be returned.
-  // Do a BFS on the directory to discover all the sub-directories. Remove all
-  // children that are files along the way. Then cleanup and remove the
-  // directories in reverse order.;
-  while (!dir_q.empty()) {
-    string dir = dir_q.front();
-    dir_q.pop_front();
-    dir_list.push_back(dir);
-    std::vector<string> children;
-    // GetChildren might fail if we don't have appropriate permissions.
-    Status s = fs->GetChildren(dir, &children);
-    ret.Update(s);
-    if (!s.ok()) {
-      (*undeleted_dirs)++;
-      continue;
-    }
-    for (const string& child : children) {
-      const string child_path = io::JoinPath(dir, child);
-      // If the child is a directory add it to the queue, otherwise delete it.
-      if (fs->IsDirectory(child_path).ok()) {
-        dir_q.push_back(child_path);
-      } else {
-        // Delete file might fail because of permissions issues or might be
-        // unimplemented.
-        Status del_status = fs->DeleteFile(child_path);
-        ret.Update(del_status);
-        if (!del_status.ok()) {
-          (*undeleted_files)++;
-        }
-      }
-    }
-  }
-  // Now reverse the list of directories and delete them. The BFS ensures that
-  // we can delete the directories in this order.
-  std::reverse(dir_list.begin(), dir_list.end());
-  for (const string& dir : dir_list) {
-    // Delete dir might fail because of permissions issues or might be
-    // unimplemented.
-    Status s = fs->DeleteDir(dir);
-    ret.Update(s);
-    if (!s.ok()) {
-      (*undeleted_dirs)++;
-    }
-  }
-  return Status::OK();
+  return fs->DeleteRecursively(dirname, undeleted_files, undeleted_dirs);
 }
 
 Status Env::GetFileSize(const string& fname, uint64* file_size) {
@@ -16,6 +16,7 @@ limitations under the License.
 #include "tensorflow/core/platform/env.h"
 
 #include <sys/stat.h>
+#include <unistd.h>
 
 #include "tensorflow/core/lib/core/status_test_util.h"
 #include "tensorflow/core/lib/io/path.h"
@@ -124,6 +125,26 @@ TEST_F(DefaultEnvTest, DeleteRecursively) {
   EXPECT_FALSE(env_->FileExists(child1_file1));
 }
 
+TEST_F(DefaultEnvTest, DeleteRecursivelyDoesNotFollowSymlinks) {
+  // root_dir contains a symlink to other_dir, which must survive.
+  const string parent_dir = io::JoinPath(BaseDir(), "root_dir");
+  const string other_dir = io::JoinPath(BaseDir(), "other_dir");
+  const string other_file = io::JoinPath(other_dir, "other_file");
+  const string link = io::JoinPath(parent_dir, "link");
+  TF_EXPECT_OK(env_->CreateDir(parent_dir));
+  TF_EXPECT_OK(env_->CreateDir(other_dir));
+  CreateTestFile(env_, other_file, 100);
+  ASSERT_EQ(0, symlink(other_dir.c_str(), link.c_str()));
+
+  int64 undeleted_files, undeleted_dirs;
+  TF_EXPECT_OK(
+      env_->DeleteRecursively(parent_dir, &undeleted_files, &undeleted_dirs));
+  EXPECT_EQ(0, undeleted_files);
+  EXPECT_EQ(0, undeleted_dirs);
+  EXPECT_FALSE(env_->FileExists(parent_dir));
+  EXPECT_TRUE(env_->FileExists(other_file));
+}
+
 TEST_F(DefaultEnvTest, DeleteRecursivelyFail) {
   // Try to delete a non-existent directory.
   const string parent_dir = io::JoinPath(BaseDir(), "root_dir");
@@ -136,6 +157,19 @@ TEST_F(DefaultEnvTest, DeleteRecursivelyFail) {
   EXPECT_EQ(1, undeleted_dirs);
 }
 
+TEST_F(DefaultEnvTest, IsDirectory) {
+  const string dir = io::JoinPath(BaseDir(), "test_dir");
+  const string file = io::JoinPath(BaseDir(), "test_file");
+  EXPECT_EQ(error::NOT_FOUND, env_->IsDirectory(dir).code());
+  TF_EXPECT_OK(env_->CreateDir(dir));
+  TF_EXPECT_OK(env_->IsDirectory(dir));
+  CreateTestFile(env_, file, 100);
+  EXPECT_EQ(error::FAILED_PRECONDITION, env_->IsDirectory(file).code());
+  // A path through a non-directory doesn't exist either.
+  EXPECT_EQ(error::NOT_FOUND,
+            env_->IsDirectory(io::JoinPath(file, "child")).code());
+}
+
 TEST_F(DefaultEnvTest, RecursivelyCreateDir) {
   const string create_path = io::JoinPath(BaseDir(), "a//b/c/d");
   TF_CHECK_OK(env_->RecursivelyCreateDir(create_path));
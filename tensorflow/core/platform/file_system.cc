@@ -14,6 +14,7 @@ limitations under the License.
 ==============================================================================*/
 
 #include <sys/stat.h>
+#include <algorithm>
 #include <deque>
 
 #include "tensorflow/core/lib/core/errors.h"
@@ -48,6 +49,89 @@ Status FileSystem::IsDirectory(const string& name) {
   return Status(tensorflow::error::FAILED_PRECONDITION, "Not a directory");
 }
 
+Status FileSystem::DeleteRecursively(const string& dirname,
+                                     int64* undeleted_files,
+                                     int64* undeleted_dirs) {
+  CHECK_NOTNULL(undeleted_files);
+  CHECK_NOTNULL(undeleted_dirs);
+
+  *undeleted_files = 0;
+  *undeleted_dirs = 0;
+  // Make sure that dirname exists;
+  if (!FileExists(dirname)) {
+    (*undeleted_dirs)++;
+    return Status(error::NOT_FOUND, "Directory doesn't exist");
+  }
+  std::deque<string> dir_q;      // Queue for the BFS
+  std::vector<string> dir_list;  // List of all dirs discovered
+  dir_q.push_back(dirname);
+  Status ret;  // Status to be returned.
+  // Do a BFS on the directory to discover all the sub-directories. Remove all
+  // children that are files along the way. Then cleanup and remove the
+  // directories in reverse order.;
+  while (!dir_q.empty()) {
+    string dir = dir_q.front();
+    dir_q.pop_front();
+    dir_list.push_back(dir);
+    std::vector<string> children;
+    // GetChildren might fail if we don't have appropriate permissions.
+    Status s = GetChildren(dir, &children);
+    ret.Update(s);
+    if (!s.ok()) {
+      (*undeleted_dirs)++;
+      continue;
+    }
+    for (const string& child : children) {
+      // Some file systems (e.g. GCS) list the directory's own marker object
+      // as an empty child; DeleteDir() below takes care of it.
+      if (child.empty()) {
+        continue;
+      }
+      const string child_path = io::JoinPath(dir, child);
+      // A child listed with a trailing '/' is a directory (e.g. on GCS), and
+      // DeleteFile() on it would only remove its marker object. Any other
+      // child is most likely a file, so try to delete it first: that saves an
+      // IsDirectory() call per file, and symlinks (including ones pointing at
+      // directories) are removed rather than followed. Only if that fails
+      // check whether the child is a directory to descend into.
+      const bool maybe_file = child.back() != '/';
+      Status del_status;
+      if (maybe_file) {
+        del_status = DeleteFile(child_path);
+        if (del_status.ok()) {
+          continue;
+        }
+      }
+      if (IsDirectory(child_path).ok()) {
+        dir_q.push_back(child_path);
+        continue;
+      }
+      if (!maybe_file) {
+        del_status = DeleteFile(child_path);
+      }
+      // Delete file might fail because of permissions issues or might be
+      // unimplemented.
+      ret.Update(del_status);
+      if (!del_status.ok()) {
+        (*undeleted_files)++;
+      }
+    }
+  }
+  // Now reverse the list of directories and delete them. The BFS ensures that
+  // we can delete the directories in this order.
+  std::reverse(dir_list.begin(), dir_list.end());
+  for (const string& dir : dir_list) {
+    // Delete dir might fail because of permissions issues or might be
+    // unimplemented.
+    Status s = DeleteDir(dir);
+    ret.Update(s);
+    if (!s.ok()) {
+      (*undeleted_dirs)++;
+    }
+  }
+  return ret;
+}
+
 RandomAccessFile::~RandomAccessFile() {}
 
 WritableFile::~WritableFile() {}
@@ -111,10 +195,29 @@ Status FileSystem::GetMatchingPaths(const string& pattern,
     std::vector<string> children;
     Status s = GetChildren(current_dir, &children);
     ret.Update(s);
+    // Wildcards never match '/', so a match has exactly as many path
+    // components as the pattern. Only descend into a child if the pattern
+    // continues past the children's depth and the child matches the pattern
+    // up to that depth; this avoids listing and stat-ing subtrees that can
+    // never match. The children all share the same depth, so find the
+    // truncated pattern once per directory.
+    const size_t child_depth =
+        std::count(current_dir.begin(), current_dir.end(), '/') +
+        (current_dir.back() == '/' ? 0 : 1);
+    size_t next_slash = string::npos;
+    for (size_t i = 0, seen = 0; i < pattern.size(); ++i) {
+      if (pattern[i] == '/' && seen++ == child_depth) {
+        next_slash = i;
+        break;
+      }
+    }
+    const string child_pattern =
+        next_slash == string::npos ? "" : pattern.substr(0, next_slash);
     for (const string& child : children) {
       const string child_path = io::JoinPath(current_dir, child);
-      // If the child is a directory add it to the queue.
-      if (IsDirectory(child_path).ok()) {
+      if (!child_pattern.empty() &&
+          Env::Default()->MatchPath(child_path, child_pattern) &&
+          IsDirectory(child_path).ok()) {
         dir_q.push_back(child_path);
       }
       all_files.push_back(child_path);
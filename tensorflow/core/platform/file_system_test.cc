@@ -27,7 +27,12 @@ namespace tensorflow {
 
 class InterPlanetaryFileSystem : public NullFileSystem {
  public:
+  // Paths passed to IsDirectory() and GetChildren(), in call order.
+  std::vector<string> stat_calls;
+  std::vector<string> list_calls;
+
   Status IsDirectory(const string& dirname) override {
+    stat_calls.push_back(dirname);
     if (dirname == "ipfs://solarsystem" ||
         dirname == "ipfs://solarsystem/Earth" ||
         dirname == "ipfs://solarsystem/Jupiter") {
@@ -37,6 +42,7 @@ class InterPlanetaryFileSystem : public NullFileSystem {
   }
 
   Status GetChildren(const string& dir, std::vector<string>* result) override {
+    list_calls.push_back(dir);
     std::vector<string> celestial_bodies;
     if (dir == "ipfs://solarsystem") {
       celestial_bodies = {"Mercury",  "Venus",   "Earth",  "Mars",
@@ -56,11 +62,11 @@ class InterPlanetaryFileSystem : public NullFileSystem {
 
 // Returns all the matched entries as a comma separated string removing the
 // common prefix of BaseDir().
-string Match(const string& base_dir, const string& suffix_pattern) {
-  InterPlanetaryFileSystem fs;
+string Match(const string& base_dir, const string& suffix_pattern,
+             InterPlanetaryFileSystem* fs) {
   std::vector<string> results;
   Status s =
-      fs.GetMatchingPaths(io::JoinPath(base_dir, suffix_pattern), &results);
+      fs->GetMatchingPaths(io::JoinPath(base_dir, suffix_pattern), &results);
   if (!s.ok()) {
     return s.ToString();
   } else {
@@ -75,6 +81,11 @@ string Match(const string& base_dir, const string& suffix_pattern) {
   }
 }
 
+string Match(const string& base_dir, const string& suffix_pattern) {
+  InterPlanetaryFileSystem fs;
+  return Match(base_dir, suffix_pattern, &fs);
+}
+
 TEST(TestFileSystem, IPFSMatch) {
   // Make sure we only get the 11 planets and not all their children.
   EXPECT_EQ(Match("ipfs://solarsystem", "*"),
@@ -89,4 +100,29 @@ TEST(TestFileSystem, IPFSMatch) {
   EXPECT_EQ(Match("ipfs://solarsystem", "Planet[0-1]"), "Planet0,Planet1");
 }
 
+TEST(TestFileSystem, IPFSMatchPrunesWalk) {
+  // A single-level pattern never descends into any directory.
+  InterPlanetaryFileSystem top_fs;
+  EXPECT_EQ(Match("ipfs://solarsystem", "*", &top_fs),
+            ".PlanetX,Earth,Jupiter,Mars,Mercury,Neptune,Planet0,Planet1,"
+            "Saturn,Uranus,Venus");
+  EXPECT_EQ(std::vector<string>({"ipfs://solarsystem"}), top_fs.list_calls);
+  EXPECT_TRUE(top_fs.stat_calls.empty());
+
+  // Only directories matching the pattern's prefix are stat-ed and listed.
+  InterPlanetaryFileSystem earth_fs;
+  EXPECT_EQ(Match("ipfs://solarsystem", "E*/*", &earth_fs), "Earth/Moon");
+  EXPECT_EQ(std::vector<string>({"ipfs://solarsystem/Earth"}),
+            earth_fs.stat_calls);
+  EXPECT_EQ(std::vector<string>(
+                {"ipfs://solarsystem", "ipfs://solarsystem/Earth"}),
+            earth_fs.list_calls);
+
+  // Nothing is stat-ed below the pattern's depth.
+  InterPlanetaryFileSystem moons_fs;
+  EXPECT_EQ(Match("ipfs://solarsystem", "*/[G-I]*", &moons_fs),
+            "Jupiter/Ganymede,Jupiter/Io");
+  EXPECT_EQ(11, moons_fs.stat_calls.size());
+}
+
 }  // namespace tensorflow
@@ -263,6 +263,21 @@ Status PosixFileSystem::Stat(const string& fname, FileStatistics* stats) {
   return s;
 }
 
+Status PosixFileSystem::IsDirectory(const string& fname) {
+  // A single stat() answers both "does it exist" and "is it a directory",
+  // so avoid the FileExists() + Stat() pair of the default implementation.
+  // Any stat() failure is reported as NOT_FOUND, matching the FileExists()
+  // check of the default implementation (e.g. for ENOTDIR or EACCES).
+  struct stat sbuf;
+  if (stat(TranslateName(fname).c_str(), &sbuf) != 0) {
+    return Status(error::NOT_FOUND, "Path not found");
+  }
+  if (!S_ISDIR(sbuf.st_mode)) {
+    return Status(error::FAILED_PRECONDITION, "Not a directory");
+  }
+  return Status::OK();
+}
+
 Status PosixFileSystem::RenameFile(const string& src, const string& target) {
   Status result;
   if (rename(TranslateName(src).c_str(), TranslateName(target).c_str()) != 0) {
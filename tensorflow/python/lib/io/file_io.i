@@ -19,12 +19,15 @@ limitations under the License.
 %{
 #include "tensorflow/c/tf_status_helper.h"
 #include "tensorflow/core/framework/types.h"
+#include "tensorflow/core/lib/core/errors.h"
 #include "tensorflow/core/lib/core/status.h"
 #include "tensorflow/core/lib/core/stringpiece.h"
 #include "tensorflow/core/lib/io/buffered_inputstream.h"
 #include "tensorflow/core/lib/io/inputstream_interface.h"
 #include "tensorflow/core/lib/io/random_inputstream.h"
 #include "tensorflow/core/lib/io/path.h"
+#include "tensorflow/core/lib/random/random.h"
+#include "tensorflow/core/lib/strings/strcat.h"
 #include "tensorflow/core/platform/env.h"
 #include "tensorflow/core/platform/file_statistics.h"
 #include "tensorflow/core/platform/file_system.h"
@@ -77,6 +80,16 @@ std::vector<string> GetMatchingFiles(const string& filename,
   return results;
 }
 
+std::vector<string> GetChildren(const string& dir, TF_Status* out_status) {
+  std::vector<string> results;
+  tensorflow::Status status = tensorflow::Env::Default()->GetChildren(
+      dir, &results);
+  if (!status.ok()) {
+    Set_TF_Status_from_Status(out_status, status);
+  }
+  return results;
+}
+
 void CreateDir(const string& dirname, TF_Status* out_status) {
   tensorflow::Status status = tensorflow::Env::Default()->CreateDir(dirname);
   if (!status.ok() && status.code() != tensorflow::error::ALREADY_EXISTS) {
@@ -92,22 +105,73 @@ void RecursivelyCreateDir(const string& dirname, TF_Status* out_status) {
   }
 }
 
+// Streams the contents of src into a new file at dst through a fixed-size
+// buffer rather than reading the whole file into memory first.
+tensorflow::Status CopyFileContents(const string& src, const string& dst) {
+  std::unique_ptr<tensorflow::RandomAccessFile> src_file;
+  TF_RETURN_IF_ERROR(
+      tensorflow::Env::Default()->NewRandomAccessFile(src, &src_file));
+  std::unique_ptr<tensorflow::WritableFile> dst_file;
+  TF_RETURN_IF_ERROR(
+      tensorflow::Env::Default()->NewWritableFile(dst, &dst_file));
+  const size_t kCopyBufferSize = 1 << 20;
+  std::unique_ptr<char[]> scratch(new char[kCopyBufferSize]);
+  tensorflow::uint64 offset = 0;
+  bool eof = false;
+  while (!eof) {
+    tensorflow::StringPiece chunk;
+    tensorflow::Status status =
+        src_file->Read(offset, kCopyBufferSize, &chunk, scratch.get());
+    // OUT_OF_RANGE means we hit the end of the file; chunk holds the tail.
+    eof = tensorflow::errors::IsOutOfRange(status);
+    if (!status.ok() && !eof) {
+      return status;
+    }
+    TF_RETURN_IF_ERROR(dst_file->Append(chunk));
+    offset += chunk.size();
+  }
+  return dst_file->Close();
+}
+
 void CopyFile(const string& oldpath, const string& newpath, bool overwrite,
               TF_Status* out_status) {
+  tensorflow::Env* env = tensorflow::Env::Default();
+  const bool newpath_exists = FileExists(newpath);
   // If overwrite is false and the newpath file exists then it's an error.
-  if (!overwrite && FileExists(newpath)) {
+  if (!overwrite && newpath_exists) {
     TF_SetStatus(out_status, TF_ALREADY_EXISTS, "file already exists");
     return;
   }
-  string file_content;
-  tensorflow::Status status = ReadFileToString(tensorflow::Env::Default(),
-      oldpath, &file_content);
-  if (!status.ok()) {
-    Set_TF_Status_from_Status(out_status, status);
+  if (!newpath_exists) {
+    // Nothing to clobber and newpath can't alias oldpath, so stream straight
+    // into place and only clean up a partial copy on failure.
+    tensorflow::Status status = CopyFileContents(oldpath, newpath);
+    if (!status.ok()) {
+      // Best-effort cleanup; newpath may not have been created.
+      env->DeleteFile(newpath);
+      Set_TF_Status_from_Status(out_status, status);
+    }
     return;
   }
-  status = WriteStringToFile(tensorflow::Env::Default(), newpath, file_content);
+  // newpath exists and may even be oldpath under another name. Copy into a
+  // temporary file next to it and only rename that into place once the copy
+  // succeeded, so a failed read never clobbers newpath and a self-copy never
+  // truncates the source.
+  const string tmp_path = tensorflow::strings::StrCat(
+      newpath, ".tmp", tensorflow::random::New64());
+  tensorflow::Status status = CopyFileContents(oldpath, tmp_path);
+  if (status.ok()) {
+    status = env->RenameFile(tmp_path, newpath);
+    // Some file systems (e.g. HDFS) refuse to rename onto an existing file;
+    // remove the old target explicitly and retry.
+    if (!status.ok() && env->FileExists(newpath) &&
+        env->DeleteFile(newpath).ok()) {
+      status = env->RenameFile(tmp_path, newpath);
+    }
+  }
   if (!status.ok()) {
+    // Best-effort cleanup; the temporary file may not have been created.
+    env->DeleteFile(tmp_path);
     Set_TF_Status_from_Status(out_status, status);
   }
 }
@@ -245,6 +309,7 @@ void WriteStringToFile(const string& filename, const string& file_content,
                        TF_Status* out_status);
 std::vector<string> GetMatchingFiles(const string& filename,
                                      TF_Status* out_status);
+std::vector<string> GetChildren(const string& dir, TF_Status* out_status);
 void CreateDir(const string& dirname, TF_Status* out_status);
 void RecursivelyCreateDir(const string& dirname, TF_Status* out_status);
 void CopyFile(const string& oldpath, const string& newpath, bool overwrite,
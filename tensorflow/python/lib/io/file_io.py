@@ -100,11 +100,11 @@ class FileIO(object):
       n: Read 'n' bytes if n != -1.  If n = -1, reads to end of file.
     """
     self._preread_check()
+    if n == -1:
+      length = self.size() - self.tell()
+    else:
+      length = n
     with errors.raise_exception_on_not_ok_status() as status:
-      if n == -1:
-        length = self.size() - self.tell()
-      else:
-        length = n
       return pywrap_tensorflow.ReadFromStream(self._read_buf, length, status)
 
   def seek(self, position):
@@ -122,11 +122,14 @@ class FileIO(object):
     """Returns all lines from the file in a list."""
     self._preread_check()
     lines = []
+    # Read straight from the stream rather than through readline() so the
+    # pre-read check only runs once for the whole file.
+    read_line = self._read_buf.ReadLineAsString
     while True:
-      s = self.readline()
+      s = read_line()
       if not s:
         break
-      lines.append(s)
+      lines.append(compat.as_str_any(s))
     return lines
 
   def tell(self):
@@ -153,8 +156,7 @@ class FileIO(object):
       raise StopIteration()
     return retval
 
-  def __next__(self):
-    return self.next()
+  __next__ = next
 
   def flush(self):
     """Flushes the Writable file.
@@ -340,8 +342,14 @@ def is_directory(dirname):
   Raises:
     errors.OpError: If the path doesn't exist or other errors
   """
+  # IsDirectory reports errors by returning False, so the status is only
+  # needed to satisfy the wrapper and is never inspected; make sure it is
+  # freed rather than leaked on every call.
   status = pywrap_tensorflow.TF_NewStatus()
-  return pywrap_tensorflow.IsDirectory(compat.as_bytes(dirname), status)
+  try:
+    return pywrap_tensorflow.IsDirectory(compat.as_bytes(dirname), status)
+  finally:
+    pywrap_tensorflow.TF_DeleteStatus(status)
 
 
 def list_directory(dirname):
@@ -361,11 +369,18 @@ def list_directory(dirname):
   """
   if not is_directory(dirname):
     raise errors.NotFoundError(None, None, "Could not find directory")
-  file_list = get_matching_files(os.path.join(compat.as_str_any(dirname), "*"))
-  return [
-      compat.as_str_any(pywrap_tensorflow.Basename(compat.as_bytes(filename)))
-      for filename in file_list
-  ]
+  with errors.raise_exception_on_not_ok_status() as status:
+    children = pywrap_tensorflow.GetChildren(compat.as_bytes(dirname), status)
+  # Convert each element to string, since the return values of the
+  # vector of string should be interpreted as strings, not bytes. Some file
+  # systems (e.g. GCS) list subdirectories with a trailing slash and the
+  # directory's own marker object as an empty name; drop both forms.
+  entries = []
+  for child in children:
+    child = compat.as_str_any(child).rstrip("/")
+    if child:
+      entries.append(child)
+  return entries
 
 
 def walk(top, in_order=True):
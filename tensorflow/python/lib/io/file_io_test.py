@@ -112,6 +112,37 @@ class FileIoTest(tf.test.TestCase):
     self.assertEqual(b"testing", f.read())
     self.assertEqual(7, f.tell())
 
+  def testCopyLargeFile(self):
+    file_path = os.path.join(self._base_dir, "temp_file")
+    # Larger than a single copy chunk, and not a multiple of it.
+    file_contents = b"0123456789" * (300 * 1024)
+    file_io.write_string_to_file(file_path, file_contents)
+    copy_path = os.path.join(self._base_dir, "copy_file")
+    file_io.copy(file_path, copy_path)
+    self.assertEqual(file_contents, file_io.read_file_to_string(copy_path))
+
+  def testCopyToSelf(self):
+    file_path = os.path.join(self._base_dir, "temp_file")
+    file_io.FileIO(file_path, mode="w").write("testing")
+    file_io.copy(file_path, file_path, overwrite=True)
+    self.assertEqual(b"testing", file_io.read_file_to_string(file_path))
+
+  def testCopyToAliasedSelf(self):
+    file_path = os.path.join(self._base_dir, "temp_file")
+    file_io.FileIO(file_path, mode="w").write("testing")
+    aliased_path = os.path.join(self._base_dir, ".", "temp_file")
+    file_io.copy(file_path, aliased_path, overwrite=True)
+    self.assertEqual(b"testing", file_io.read_file_to_string(file_path))
+
+  def testCopyFailureKeepsDestination(self):
+    file_path = os.path.join(self._base_dir, "missing_file")
+    copy_path = os.path.join(self._base_dir, "copy_file")
+    file_io.FileIO(copy_path, mode="w").write("copy")
+    with self.assertRaises(errors.NotFoundError):
+      file_io.copy(file_path, copy_path, overwrite=True)
+    self.assertEqual(b"copy", file_io.read_file_to_string(copy_path))
+    self.assertItemsEqual(["copy_file"], file_io.list_directory(self._base_dir))
+
   def testCopyOverwrite(self):
     file_path = os.path.join(self._base_dir, "temp_file")
     file_io.FileIO(file_path, mode="w").write("testing")
@@ -121,6 +152,17 @@ class FileIoTest(tf.test.TestCase):
     self.assertTrue(file_io.file_exists(copy_path))
     self.assertEqual(b"testing", file_io.FileIO(file_path, mode="r").read())
 
+  def testCopyOverwriteReplacesDestination(self):
+    file_path = os.path.join(self._base_dir, "temp_file")
+    file_io.FileIO(file_path, mode="w").write("testing")
+    copy_path = os.path.join(self._base_dir, "copy_file")
+    file_io.FileIO(copy_path, mode="w").write("a longer copy")
+    file_io.copy(file_path, copy_path, overwrite=True)
+    self.assertEqual(b"testing", file_io.read_file_to_string(copy_path))
+    # No temporary file is left behind next to the destination.
+    self.assertItemsEqual(["temp_file", "copy_file"],
+                          file_io.list_directory(self._base_dir))
+
   def testCopyOverwriteFalse(self):
     file_path = os.path.join(self._base_dir, "temp_file")
     file_io.FileIO(file_path, mode="w").write("testing")
@@ -189,6 +231,16 @@ class FileIoTest(tf.test.TestCase):
     dir_list = file_io.list_directory(dir_path)
     self.assertItemsEqual(files + ["sub_dir"], dir_list)
 
+  def testListDirectorySubdirAndDotfile(self):
+    dir_path = os.path.join(self._base_dir, "test_dir")
+    file_io.create_dir(dir_path)
+    file_io.FileIO(os.path.join(dir_path, ".hidden"), mode="w").write("x")
+    file_io.create_dir(os.path.join(dir_path, "sub_dir"))
+    file_io.FileIO(
+        os.path.join(dir_path, "sub_dir", "file.txt"), mode="w").write("x")
+    self.assertItemsEqual([".hidden", "sub_dir"],
+                          file_io.list_directory(dir_path))
+
   def testListDirectoryFailure(self):
     dir_path = os.path.join(self._base_dir, "test_dir")
     with self.assertRaises(errors.NotFoundError):